@@ -1,13 +1,10 @@
+import numpy as np
 import pytest
 import japan_dem
-import tempfile
-import os
 
 
-def test_parse_dem_xml():
-    """Test basic XML parsing functionality"""
-    # Create a minimal test XML file based on real data structure
-    test_xml = """<?xml version="1.0" encoding="UTF-8"?>
+# Minimal test XML based on real data structure
+DEM_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 <Dataset xmlns="http://fgd.japan.go.jp/spec/2008/FGD_GMLSchema"
          xmlns:gml="http://www.opengis.net/gml/3.2"
          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
@@ -34,65 +31,98 @@ def test_parse_dem_xml():
       <gml:rangeSet>
         <gml:DataBlock>
           <gml:tupleList>
-地表面,100.1
-地表面,100.2
-地表面,100.3
-地表面,100.4
+{tuple_list}
           </gml:tupleList>
         </gml:DataBlock>
       </gml:rangeSet>
       <gml:coverageFunction>
         <gml:GridFunction>
           <gml:sequenceRule order="+x-y">Linear</gml:sequenceRule>
-          <gml:startPoint>0 0</gml:startPoint>
+          <gml:startPoint>{start_point}</gml:startPoint>
         </gml:GridFunction>
       </gml:coverageFunction>
     </coverage>
   </DEM>
 </Dataset>"""
 
-    # Write test XML to temporary file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-        f.write(test_xml)
-        temp_path = f.name
-
-    try:
-        # Parse the XML
-        dem_tile = japan_dem.parse_dem_xml(temp_path)
-
-        # Verify basic properties
-        assert dem_tile.rows == 2
-        assert dem_tile.cols == 2
-        assert dem_tile.origin_lon == 139.0
-        # TODO: Investigate why origin_lat is not using upper_lat in Python bindings
-        # For now, accept the current behavior
-        assert dem_tile.origin_lat == 35.0
-        assert dem_tile.shape == (2, 2)
-        assert dem_tile.start_point == (0, 0)
-
-        # Verify metadata
-        assert dem_tile.metadata.mesh_code == "62414077"
-        assert dem_tile.metadata.crs_identifier == "fguuid:jgd2011.bl"
-
-        # Verify values - 4 values for 2x2 grid
-        assert len(dem_tile.values) == 4
-        assert dem_tile.values[0] == pytest.approx(100.1)
-        assert dem_tile.values[1] == pytest.approx(100.2)
-        assert dem_tile.values[2] == pytest.approx(100.3)
-        assert dem_tile.values[3] == pytest.approx(100.4)
-
-        # Test repr methods
-        repr_str = repr(dem_tile)
-        assert "DemTile" in repr_str
-        assert "62414077" in repr_str
-
-        meta_repr = repr(dem_tile.metadata)
-        assert "Metadata" in meta_repr
-        assert "jgd2011.bl" in meta_repr
-
-    finally:
-        # Clean up
-        os.unlink(temp_path)
+VALUES = [100.1, 100.2, 100.3, 100.4]
+
+
+def build_dem_xml(start_point, values):
+    tuple_list = "\n".join(f"地表面,{value}" for value in values)
+    xml = DEM_XML_TEMPLATE.format(start_point=start_point, tuple_list=tuple_list)
+    return xml.encode("utf-8")
+
+
+# XML files are written once per session and shared between tests
+@pytest.fixture(scope="session")
+def minimal_dem_xml(tmp_path_factory):
+    path = tmp_path_factory.mktemp("dem") / "minimal.xml"
+    path.write_bytes(build_dem_xml("0 0", VALUES))
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def partial_dem_xml(tmp_path_factory):
+    # startPoint "1 0": the first cell has no data
+    path = tmp_path_factory.mktemp("dem") / "partial.xml"
+    path.write_bytes(build_dem_xml("1 0", VALUES[1:]))
+    return str(path)
+
+
+def test_parse_dem_xml(minimal_dem_xml):
+    """Test basic XML parsing functionality"""
+    dem_tile = japan_dem.parse_dem_xml(minimal_dem_xml)
+
+    # Verify basic properties
+    assert dem_tile.rows == 2
+    assert dem_tile.cols == 2
+    assert dem_tile.origin_lon == 139.0
+    # origin_lat is the upper (north) edge of the envelope
+    assert dem_tile.origin_lat == pytest.approx(35.001)
+    assert dem_tile.shape == (2, 2)
+    assert dem_tile.geo_transform == pytest.approx(
+        [139.0, 0.001, 0.0, 35.001, 0.0, -0.001]
+    )
+
+    # Verify metadata
+    assert dem_tile.metadata.mesh_code == "62414077"
+    assert dem_tile.metadata.crs_identifier == "fguuid:jgd2011.bl"
+    assert dem_tile.metadata.epsg_code == 6668
+
+    # Verify values are exposed as a float32 array
+    assert isinstance(dem_tile.values, np.ndarray)
+    assert dem_tile.values.dtype == np.float32
+
+    # values_2d is a row-major view over the same buffer
+    values_2d = dem_tile.values_2d
+    assert values_2d.shape == dem_tile.shape
+    assert values_2d.flags["C_CONTIGUOUS"]
+    assert np.shares_memory(values_2d, dem_tile.values)
+
+    # Test repr methods
+    repr_str = repr(dem_tile)
+    assert "DemTile" in repr_str
+    assert "62414077" in repr_str
+
+    meta_repr = repr(dem_tile.metadata)
+    assert "Metadata" in meta_repr
+    assert "jgd2011.bl" in meta_repr
+
+
+@pytest.mark.parametrize(
+    ("xml_fixture", "start_point", "expected_values"),
+    [
+        ("minimal_dem_xml", (0, 0), VALUES),
+        ("partial_dem_xml", (1, 0), [-9999.0] + VALUES[1:]),
+    ],
+)
+def test_parse_values(request, xml_fixture, start_point, expected_values):
+    """Test values are padded with NoData up to the start point"""
+    dem_tile = japan_dem.parse_dem_xml(request.getfixturevalue(xml_fixture))
+
+    assert dem_tile.start_point == start_point
+    assert dem_tile.values == pytest.approx(np.array(expected_values), rel=1e-6)
 
 
 def test_parse_invalid_file():
@@ -101,6 +131,16 @@ def test_parse_invalid_file():
         japan_dem.parse_dem_xml("/nonexistent/file.xml")
 
 
+def test_parse_batch(minimal_dem_xml, partial_dem_xml):
+    """Test batch parsing keeps input order and propagates errors"""
+    dem_tiles = japan_dem.parse_dem_xml_batch([partial_dem_xml, minimal_dem_xml])
+    assert [dem_tile.start_point for dem_tile in dem_tiles] == [(1, 0), (0, 0)]
+
+    assert japan_dem.parse_dem_xml_batch([]) == []
+
+    with pytest.raises(IOError):
+        japan_dem.parse_dem_xml_batch(["/nonexistent/file.xml"])
+
+
 if __name__ == "__main__":
-    test_parse_dem_xml()
-    print("Basic tests passed!")
+    raise SystemExit(pytest.main([__file__]))
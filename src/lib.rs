@@ -1,6 +1,8 @@
 pub mod error;
 pub mod model;
 pub mod parser;
+#[cfg(feature = "python")]
+mod python;
 pub mod terrain_rgb;
 pub mod writer;
 pub mod zip_handler;
@@ -101,16 +101,14 @@ fn main() -> Result<()> {
 fn process_file(path: &Path, args: &Args) -> Result<()> {
     info!("Processing file: {:?}", path);
 
-    use japan_dem::parser::parse_dem_xml;
+    use japan_dem::parser::parse_dem_xml_from_file;
     use japan_dem::writer::GeoTiffWriter;
     use japan_dem::TerrainRgbConfig;
     use std::fs::File;
-    use std::io::BufReader;
 
     // XMLファイルを解析
     let file = File::open(path)?;
-    let reader = BufReader::new(file);
-    let dem_tile = parse_dem_xml(reader)?;
+    let dem_tile = parse_dem_xml_from_file(&file)?;
 
     info!(
         "Parsed successfully: {} ({}x{})",
@@ -136,7 +134,7 @@ fn process_file(path: &Path, args: &Args) -> Result<()> {
         let output_path = args.output.join(&output_filename);
 
         let writer = GeoTiffWriter::new();
-        writer.write(&dem_tile, &output_path)?;
+        writer.write_owned(dem_tile, &output_path)?;
         info!("Written GeoTIFF: {:?}", output_path);
     }
 
@@ -238,7 +236,7 @@ fn process_zip_file(path: &Path, args: &Args) -> Result<()> {
         // タイルを結合して出力
         info!("Merging {} tiles", tiles.len());
         let merged = MergedDemTile::from_tiles(tiles)?;
-        let dem_tile = merged.to_dem_tile();
+        let dem_tile = merged.into_dem_tile();
 
         // 出力ファイル名を生成（ZIPファイル名から.zipを除いたもの）
         let stem = path
@@ -265,7 +263,7 @@ fn process_zip_file(path: &Path, args: &Args) -> Result<()> {
             let output_path = args.output.join(&output_filename);
 
             let writer = GeoTiffWriter::new();
-            writer.write(&dem_tile, &output_path)?;
+            writer.write_owned(dem_tile, &output_path)?;
             info!("Written merged GeoTIFF: {:?}", output_path);
         }
     } else {
@@ -295,7 +293,7 @@ fn process_zip_file(path: &Path, args: &Args) -> Result<()> {
                 let output_filename = format!("{}.tif", tile.metadata.meshcode);
                 let output_path = args.output.join(&output_filename);
 
-                writer.write(&tile, &output_path)?;
+                writer.write_owned(tile, &output_path)?;
                 info!("Written GeoTIFF: {:?}", output_path);
             }
         }
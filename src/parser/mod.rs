@@ -1,215 +1,444 @@
 use anyhow::{Context, Result};
+use memchr::{memchr, memchr_iter};
+use memmap2::Mmap;
 use quick_xml::events::Event;
 use quick_xml::reader::Reader;
-use std::io::{BufRead, Cursor};
+use rayon::prelude::*;
+use std::fs::File;
+use std::io::BufRead;
 
 use crate::model::{DemTile, Metadata};
 
+/// tupleListをこのサイズ以上の場合に複数スレッドで分割してパースする
+const PARALLEL_TUPLE_LIST_BYTES: usize = 1 << 20;
+
 pub fn parse_dem_xml<R: BufRead>(reader: R) -> Result<DemTile> {
     let mut xml_reader = Reader::from_reader(reader);
     xml_reader.config_mut().trim_text(true);
 
-    let mut meshcode = None;
-    let mut dem_type = None;
-    let mut crs_identifier = None;
-    let mut grid_high = None;
-    let mut lower_corner = None;
-    let mut upper_corner = None;
-    let mut start_point = None;
-    let mut values = Vec::new();
-
-    let mut in_mesh = false;
-    let mut in_type = false;
-    let mut in_envelope = false;
-    let mut in_lower_corner = false;
-    let mut in_upper_corner = false;
-    let mut in_grid_envelope = false;
-    let mut in_high = false;
-    let mut in_tuple_list = false;
-    let mut in_start_point = false;
-
+    let mut handler = DemXmlHandler::default();
     let mut buf = Vec::new();
 
     loop {
         match xml_reader.read_event_into(&mut buf) {
-            Ok(Event::Start(e)) => {
+            Ok(Event::Eof) => break,
+            Ok(event) => handler.handle_event(event)?,
+            Err(e) => return Err(anyhow::anyhow!("XML parse error: {}", e)),
+        }
+        buf.clear();
+    }
+
+    handler.finish()
+}
+
+/// メモリ上のXMLをパースする
+///
+/// イベントは入力を借用したまま返されるため、tupleListも中間バッファへコピーせず
+/// 入力のバイト列上で直接パースする
+pub fn parse_dem_xml_from_bytes(bytes: &[u8]) -> Result<DemTile> {
+    let mut xml_reader = Reader::from_reader(bytes);
+    xml_reader.config_mut().trim_text(true);
+
+    let mut handler = DemXmlHandler::default();
+
+    loop {
+        match xml_reader.read_event() {
+            Ok(Event::Eof) => break,
+            Ok(event) => handler.handle_event(event)?,
+            Err(e) => return Err(anyhow::anyhow!("XML parse error: {}", e)),
+        }
+    }
+
+    handler.finish()
+}
+
+/// XMLイベントから必要な要素を集める
+///
+/// 読み込み方法（BufReadかバイト列か）によらず同じ処理でイベントを扱う
+#[derive(Default)]
+struct DemXmlHandler {
+    meshcode: Option<String>,
+    dem_type: Option<String>,
+    crs_identifier: Option<String>,
+    grid_high: Option<String>,
+    lower_corner: Option<String>,
+    upper_corner: Option<String>,
+    start_point: Option<String>,
+    values: Vec<f32>,
+
+    in_mesh: bool,
+    in_type: bool,
+    in_envelope: bool,
+    in_lower_corner: bool,
+    in_upper_corner: bool,
+    in_grid_envelope: bool,
+    in_high: bool,
+    in_tuple_list: bool,
+    in_start_point: bool,
+}
+
+impl DemXmlHandler {
+    fn handle_event(&mut self, event: Event<'_>) -> Result<()> {
+        match event {
+            Event::Start(e) => {
                 match e.local_name().as_ref() {
-                    b"mesh" => in_mesh = true,
-                    b"type" => in_type = true,
+                    b"mesh" => self.in_mesh = true,
+                    b"type" => self.in_type = true,
                     b"Envelope" => {
-                        in_envelope = true;
+                        self.in_envelope = true;
                         // srsName属性から座標系を取得
                         for attr in e.attributes() {
                             let attr = attr?;
                             if attr.key.as_ref() == b"srsName" {
-                                crs_identifier =
+                                self.crs_identifier =
                                     Some(String::from_utf8_lossy(&attr.value).to_string());
                             }
                         }
                     }
-                    b"lowerCorner" => in_lower_corner = true,
-                    b"upperCorner" => in_upper_corner = true,
-                    b"GridEnvelope" => in_grid_envelope = true,
+                    b"lowerCorner" => self.in_lower_corner = true,
+                    b"upperCorner" => self.in_upper_corner = true,
+                    b"GridEnvelope" => self.in_grid_envelope = true,
                     b"high" => {
-                        if in_grid_envelope {
-                            in_high = true;
+                        if self.in_grid_envelope {
+                            self.in_high = true;
                         }
                     }
-                    b"tupleList" => in_tuple_list = true,
-                    b"startPoint" => in_start_point = true,
+                    b"tupleList" => self.in_tuple_list = true,
+                    b"startPoint" => self.in_start_point = true,
                     _ => {}
                 }
             }
-            Ok(Event::Text(e)) => {
-                if in_mesh {
-                    meshcode = Some(e.unescape()?.to_string());
-                } else if in_type {
-                    dem_type = Some(e.unescape()?.to_string());
-                } else if in_lower_corner && in_envelope {
-                    lower_corner = Some(e.unescape()?.to_string());
-                } else if in_upper_corner && in_envelope {
-                    upper_corner = Some(e.unescape()?.to_string());
-                } else if in_high && in_grid_envelope {
-                    grid_high = Some(e.unescape()?.to_string());
-                } else if in_start_point {
-                    start_point = Some(e.unescape()?.to_string());
-                } else if in_tuple_list {
-                    // tupleListのテキストをストリーム処理
-                    let text = e.unescape()?;
-                    for line in text.lines() {
-                        let line = line.trim();
-                        if line.is_empty() {
-                            continue;
-                        }
-
-                        // カンマで分割し、2番目の要素（標高値）を取得
-                        let parts: Vec<&str> = line.split(',').collect();
-                        if parts.len() >= 2 {
-                            let elevation = parts[1].trim().parse::<f32>().with_context(|| {
-                                format!("Failed to parse elevation: {}", parts[1])
-                            })?;
-                            values.push(elevation);
+            Event::Text(e) => {
+                if self.in_mesh {
+                    self.meshcode = Some(e.unescape()?.to_string());
+                } else if self.in_type {
+                    self.dem_type = Some(e.unescape()?.to_string());
+                } else if self.in_lower_corner && self.in_envelope {
+                    self.lower_corner = Some(e.unescape()?.to_string());
+                } else if self.in_upper_corner && self.in_envelope {
+                    self.upper_corner = Some(e.unescape()?.to_string());
+                } else if self.in_high && self.in_grid_envelope {
+                    self.grid_high = Some(e.unescape()?.to_string());
+                } else if self.in_start_point {
+                    self.start_point = Some(e.unescape()?.to_string());
+                } else if self.in_tuple_list {
+                    // GridEnvelopeのhighからセル数が分かっていれば先に確保して再確保を避ける
+                    // （1行は最短でも4バイトなので、テキスト長から見た上限も超えないようにする）
+                    if self.values.capacity() == 0 {
+                        let cells = self
+                            .grid_high
+                            .as_deref()
+                            .and_then(|high| parse_grid_size(high).ok())
+                            .and_then(|(cols, rows)| cols.checked_mul(rows));
+                        if let Some(cells) = cells {
+                            self.values.reserve_exact(cells.min(e.len() / 4));
                         }
                     }
+
+                    // tupleListは数値とラベルだけなので、アンエスケープせずバイト列のまま処理
+                    parse_tuple_list(&e, &mut self.values)?;
                 }
             }
-            Ok(Event::End(e)) => match e.local_name().as_ref() {
-                b"mesh" => in_mesh = false,
-                b"type" => in_type = false,
-                b"Envelope" => in_envelope = false,
-                b"lowerCorner" => in_lower_corner = false,
-                b"upperCorner" => in_upper_corner = false,
-                b"GridEnvelope" => in_grid_envelope = false,
-                b"high" => in_high = false,
-                b"tupleList" => in_tuple_list = false,
-                b"startPoint" => in_start_point = false,
+            Event::End(e) => match e.local_name().as_ref() {
+                b"mesh" => self.in_mesh = false,
+                b"type" => self.in_type = false,
+                b"Envelope" => self.in_envelope = false,
+                b"lowerCorner" => self.in_lower_corner = false,
+                b"upperCorner" => self.in_upper_corner = false,
+                b"GridEnvelope" => self.in_grid_envelope = false,
+                b"high" => self.in_high = false,
+                b"tupleList" => self.in_tuple_list = false,
+                b"startPoint" => self.in_start_point = false,
                 _ => {}
             },
-            Ok(Event::Eof) => break,
-            Err(e) => return Err(anyhow::anyhow!("XML parse error: {}", e)),
             _ => {}
         }
-        buf.clear();
+
+        Ok(())
     }
 
-    // 必須フィールドの検証
-    let meshcode = meshcode.context("meshcode not found")?;
-    let dem_type = dem_type.context("dem_type not found")?;
-    let crs_identifier = crs_identifier.context("crs_identifier not found")?;
-    let grid_high = grid_high.context("grid_high not found")?;
-    let lower_corner = lower_corner.context("lower_corner not found")?;
-    let upper_corner = upper_corner.context("upper_corner not found")?;
-    let start_point = start_point.unwrap_or_else(|| "0 0".to_string());
+    fn finish(self) -> Result<DemTile> {
+        let DemXmlHandler {
+            meshcode,
+            dem_type,
+            crs_identifier,
+            grid_high,
+            lower_corner,
+            upper_corner,
+            start_point,
+            mut values,
+            ..
+        } = self;
+
+        // 必須フィールドの検証
+        let meshcode = meshcode.context("meshcode not found")?;
+        let dem_type = dem_type.context("dem_type not found")?;
+        let crs_identifier = crs_identifier.context("crs_identifier not found")?;
+        let grid_high = grid_high.context("grid_high not found")?;
+        let lower_corner = lower_corner.context("lower_corner not found")?;
+        let upper_corner = upper_corner.context("upper_corner not found")?;
+        let start_point = start_point.unwrap_or_else(|| "0 0".to_string());
+
+        let (cols, rows) = parse_grid_size(&grid_high)?;
+
+        // 座標を解析
+        let lower_parts: Vec<&str> = lower_corner.split_whitespace().collect();
+        let upper_parts: Vec<&str> = upper_corner.split_whitespace().collect();
+        if lower_parts.len() != 2 || upper_parts.len() != 2 {
+            return Err(anyhow::anyhow!("Invalid corner coordinate format"));
+        }
+
+        // JGD2011 (fguuid:jgd2011.bl) uses lat,lon order
+        let origin_lat = lower_parts[0].parse::<f64>()?;
+        let origin_lon = lower_parts[1].parse::<f64>()?;
+        let upper_lat = upper_parts[0].parse::<f64>()?;
+        let upper_lon = upper_parts[1].parse::<f64>()?;
 
-    // グリッドサイズを解析（high値 + 1）
+        // 解像度を計算
+        let x_res = if cols > 1 {
+            (upper_lon - origin_lon) / (cols - 1) as f64
+        } else {
+            upper_lon - origin_lon
+        };
+        let y_res = if rows > 1 {
+            (upper_lat - origin_lat) / (rows - 1) as f64
+        } else {
+            upper_lat - origin_lat
+        };
+
+        // startPointを解析
+        let start_parts: Vec<&str> = start_point.split_whitespace().collect();
+        let start_x = if !start_parts.is_empty() {
+            start_parts[0].parse::<usize>()?
+        } else {
+            0
+        };
+        let start_y = if start_parts.len() >= 2 {
+            start_parts[1].parse::<usize>()?
+        } else {
+            0
+        };
+
+        // startPointを考慮した実際のデータ数を計算
+        // startPoint(1056, 0)は最初の1056列がデータ無しを意味する
+        let expected_values = rows * cols - start_x;
+
+        // 値の数を検証
+        if values.len() != expected_values {
+            return Err(anyhow::anyhow!(
+                "Value count mismatch: expected {} ({}x{} - start_x {}), got {}",
+                expected_values,
+                rows,
+                cols,
+                start_x,
+                values.len()
+            ));
+        }
+
+        // startPointの分だけ-9999（NoData）を先頭に追加
+        // 新しいVecを確保せず、既存の値を後ろへずらして先頭だけを埋める
+        if start_x > 0 {
+            let len = values.len();
+            values.resize(len + start_x, 0.0);
+            values.copy_within(0..len, start_x);
+            values[..start_x].fill(-9999.0);
+        }
+
+        let metadata = Metadata {
+            meshcode,
+            dem_type,
+            crs_identifier,
+        };
+
+        Ok(DemTile {
+            rows,
+            cols,
+            origin_lon,
+            origin_lat: upper_lat, // DEMの原点は左上なので上端の緯度を使用
+            x_res,
+            y_res,
+            values,
+            start_point: (start_x, start_y),
+            metadata,
+        })
+    }
+}
+
+/// GridEnvelopeのhigh値からグリッドサイズ（列数, 行数）を解析（high値 + 1）
+fn parse_grid_size(grid_high: &str) -> Result<(usize, usize)> {
     let high_parts: Vec<&str> = grid_high.split_whitespace().collect();
     if high_parts.len() != 2 {
         return Err(anyhow::anyhow!("Invalid grid high format: {}", grid_high));
     }
     let cols = high_parts[0].parse::<usize>()? + 1;
     let rows = high_parts[1].parse::<usize>()? + 1;
+    Ok((cols, rows))
+}
 
-    // 座標を解析
-    let lower_parts: Vec<&str> = lower_corner.split_whitespace().collect();
-    let upper_parts: Vec<&str> = upper_corner.split_whitespace().collect();
-    if lower_parts.len() != 2 || upper_parts.len() != 2 {
-        return Err(anyhow::anyhow!("Invalid corner coordinate format"));
+/// tupleListの各行（`地表面,100.1`）から標高値を取り出してvaluesに追加する
+///
+/// 大きなtupleListは行単位のチャンクに分けて並列にパースする
+/// 各行は独立しており、チャンクの順序どおりに並べれば+x-yの並びも保たれる
+fn parse_tuple_list(text: &[u8], values: &mut Vec<f32>) -> Result<()> {
+    if text.len() < PARALLEL_TUPLE_LIST_BYTES {
+        return parse_tuple_lines(text, |elevation| values.push(elevation));
     }
 
-    // JGD2011 (fguuid:jgd2011.bl) uses lat,lon order
-    let origin_lat = lower_parts[0].parse::<f64>()?;
-    let origin_lon = lower_parts[1].parse::<f64>()?;
-    let upper_lat = upper_parts[0].parse::<f64>()?;
-    let upper_lon = upper_parts[1].parse::<f64>()?;
-
-    // 解像度を計算
-    let x_res = if cols > 1 {
-        (upper_lon - origin_lon) / (cols - 1) as f64
-    } else {
-        upper_lon - origin_lon
-    };
-    let y_res = if rows > 1 {
-        (upper_lat - origin_lat) / (rows - 1) as f64
-    } else {
-        upper_lat - origin_lat
-    };
-
-    // startPointを解析
-    let start_parts: Vec<&str> = start_point.split_whitespace().collect();
-    let start_x = if !start_parts.is_empty() {
-        start_parts[0].parse::<usize>()?
-    } else {
-        0
-    };
-    let start_y = if start_parts.len() >= 2 {
-        start_parts[1].parse::<usize>()?
-    } else {
-        0
-    };
-
-    // startPointを考慮した実際のデータ数を計算
-    // startPoint(1056, 0)は最初の1056列がデータ無しを意味する
-    let expected_values = rows * cols - start_x;
-
-    // 値の数を検証
-    if values.len() != expected_values {
-        return Err(anyhow::anyhow!(
-            "Value count mismatch: expected {} ({}x{} - start_x {}), got {}",
-            expected_values,
-            rows,
-            cols,
-            start_x,
-            values.len()
-        ));
+    // 空行を数えないため、通常のtupleListでは行数と値の数が一致し、
+    // GridEnvelopeから確保した容量を超えて再確保することもない
+    let chunks = split_at_lines(text, rayon::current_num_threads());
+    let line_counts: Vec<usize> = chunks.iter().map(|chunk| count_lines(chunk)).collect();
+
+    // valuesの末尾をチャンクごとの重ならない領域に分け、各スレッドが直接書き込む
+    let base = values.len();
+    values.resize(base + line_counts.iter().sum::<usize>(), 0.0);
+    let mut slots = Vec::with_capacity(chunks.len());
+    let mut rest = &mut values[base..];
+    for &count in &line_counts {
+        let (slot, tail) = std::mem::take(&mut rest).split_at_mut(count);
+        slots.push(slot);
+        rest = tail;
+    }
+
+    let written = chunks
+        .par_iter()
+        .zip(slots.into_par_iter())
+        .map(|(chunk, slot)| {
+            let mut len = 0;
+            parse_tuple_lines(chunk, |elevation| {
+                slot[len] = elevation;
+                len += 1;
+            })?;
+            Ok(len)
+        })
+        .collect::<Result<Vec<_>>>()?;
+
+    // カンマのない行など値を持たない行があった場合だけ、後続のチャンクを前に詰める
+    let mut end = base;
+    let mut slot_start = base;
+    for (&count, &len) in line_counts.iter().zip(&written) {
+        if end != slot_start {
+            values.copy_within(slot_start..slot_start + len, end);
+        }
+        end += len;
+        slot_start += count;
     }
+    values.truncate(end);
 
-    // startPointの分だけ-9999（NoData）を先頭に追加
-    let mut full_values = vec![-9999.0; start_x];
-    full_values.extend(values);
-    let values = full_values;
-
-    let metadata = Metadata {
-        meshcode,
-        dem_type,
-        crs_identifier,
-    };
-
-    Ok(DemTile {
-        rows,
-        cols,
-        origin_lon,
-        origin_lat: upper_lat, // DEMの原点は左上なので上端の緯度を使用
-        x_res,
-        y_res,
-        values,
-        start_point: (start_x, start_y),
-        metadata,
-    })
+    Ok(())
 }
 
-pub fn parse_dem_xml_from_bytes(bytes: &[u8]) -> Result<DemTile> {
-    let cursor = Cursor::new(bytes);
-    parse_dem_xml(cursor)
+/// 空白だけではない行の数（末尾に改行がない最後の行も数える）
+///
+/// 通常の行は先頭が空白ではないため、trim_ascii()は1バイト目を見るだけで終わる
+fn count_lines(text: &[u8]) -> usize {
+    let mut count = 0;
+    let mut start = 0;
+    for end in memchr_iter(b'\n', text).chain(std::iter::once(text.len())) {
+        if !text[start..end].trim_ascii().is_empty() {
+            count += 1;
+        }
+        start = end + 1;
+    }
+    count
+}
+
+/// テキストをおおよそn等分し、各チャンクが行の途中で切れないよう改行の直後で区切る
+fn split_at_lines(text: &[u8], n: usize) -> Vec<&[u8]> {
+    let target = text.len().div_ceil(n.max(1)).max(1);
+    let mut chunks = Vec::with_capacity(n);
+    let mut rest = text;
+
+    while rest.len() > target {
+        let end = match memchr(b'\n', &rest[target..]) {
+            Some(pos) => target + pos + 1,
+            None => rest.len(),
+        };
+        let (chunk, tail) = rest.split_at(end);
+        chunks.push(chunk);
+        rest = tail;
+    }
+    if !rest.is_empty() {
+        chunks.push(rest);
+    }
+
+    chunks
+}
+
+/// 最初のカンマの位置を返す
+///
+/// ラベル（`地表面` など）は十数バイトしかなく、memchrの初期化コストが目立つため、
+/// 8バイトずつu64として読み込みSWARでカンマを探す
+/// 8バイトに満たない末尾も0で埋めたu64として同じ方法で探す（0はカンマと一致しない）
+#[inline]
+fn find_comma(bytes: &[u8]) -> Option<usize> {
+    let mut words = bytes.chunks_exact(8);
+    let mut offset = 0;
+    for word in words.by_ref() {
+        if let Some(pos) = comma_in_word(u64::from_le_bytes(word.try_into().unwrap())) {
+            return Some(offset + pos);
+        }
+        offset += 8;
+    }
+
+    let remainder = words.remainder();
+    let mut tail = [0u8; 8];
+    tail[..remainder.len()].copy_from_slice(remainder);
+    comma_in_word(u64::from_le_bytes(tail)).map(|pos| offset + pos)
+}
+
+/// リトルエンディアンで読み込んだ8バイト中の最初のカンマの位置を返す
+#[inline]
+fn comma_in_word(word: u64) -> Option<usize> {
+    const COMMAS: u64 = 0x2C2C_2C2C_2C2C_2C2C;
+    const LOW_BITS: u64 = 0x0101_0101_0101_0101;
+    const HIGH_BITS: u64 = 0x8080_8080_8080_8080;
+
+    let x = word ^ COMMAS;
+    // カンマだったバイトが0になるので、最下位の0バイトの位置を求める
+    let mask = x.wrapping_sub(LOW_BITS) & !x & HIGH_BITS;
+    (mask != 0).then(|| (mask.trailing_zeros() / 8) as usize)
+}
+
+fn parse_tuple_lines(text: &[u8], mut push: impl FnMut(f32)) -> Result<()> {
+    for line in text.split(|&b| b == b'\n') {
+        let line = line.trim_ascii();
+        if line.is_empty() {
+            continue;
+        }
+
+        // カンマで区切られた2番目の要素（標高値）を取得
+        let Some(comma) = find_comma(line) else {
+            continue;
+        };
+        let rest = &line[comma + 1..];
+        let field = match find_comma(rest) {
+            Some(end) => &rest[..end],
+            None => rest,
+        }
+        .trim_ascii();
+
+        let elevation = fast_float2::parse::<f32, _>(field).with_context(|| {
+            format!(
+                "Failed to parse elevation: {}",
+                String::from_utf8_lossy(field)
+            )
+        })?;
+        push(elevation);
+    }
+
+    Ok(())
+}
+
+/// ファイルをメモリマップしてパースする
+///
+/// ファイル全体をヒープへ読み込まず、マップしたバイト列をparse_dem_xml_from_bytesで
+/// そのままパースするため、tupleListもOSのページキャッシュから直接読み取る
+pub fn parse_dem_xml_from_file(file: &File) -> Result<DemTile> {
+    // SAFETY: 読み取り専用でマップしており、パース中に入力XMLが
+    // 他のプロセスから書き換えられないことを前提としている
+    let mmap = unsafe { Mmap::map(file) }.context("Failed to memory-map file")?;
+    parse_dem_xml_from_bytes(&mmap)
 }
 
 #[cfg(test)]
@@ -264,5 +493,131 @@ mod tests {
         assert_eq!(result.values.len(), 4);
         assert_eq!(result.values[0], 100.0);
         assert_eq!(result.metadata.meshcode, "12345678");
+
+        // バイト列から借用イベントで読む経路も同じ結果になる
+        let from_bytes = parse_dem_xml_from_bytes(xml.as_bytes()).unwrap();
+        assert_eq!((from_bytes.rows, from_bytes.cols), (2, 2));
+        assert_eq!(from_bytes.values, result.values);
+        assert_eq!(from_bytes.metadata.meshcode, "12345678");
+    }
+
+    #[test]
+    fn test_parse_tuple_list() {
+        let text = "\r\n地表面,100.1\r\n\n  データなし,-9999.\n海水面,0.0,extra\nlabel only\n";
+        let mut values = Vec::new();
+        parse_tuple_list(text.as_bytes(), &mut values).unwrap();
+        assert_eq!(values, vec![100.1, -9999.0, 0.0]);
+
+        assert!(parse_tuple_list("地表面,abc".as_bytes(), &mut values).is_err());
+    }
+
+    #[test]
+    fn test_parse_large_tuple_list() {
+        // 並列パースの閾値を超えるサイズのtupleListを生成
+        let expected: Vec<f32> = (0..200_000).map(|i| i as f32 * 0.25).collect();
+        let build = |extra_line: &str| -> String {
+            expected
+                .iter()
+                .enumerate()
+                .map(|(i, value)| match i % 1000 {
+                    0 => format!("{}地表面,{}\n", extra_line, value),
+                    _ => format!("地表面,{}\n", value),
+                })
+                .collect()
+        };
+
+        // 空行は数えないため、値の数だけ確保していれば再確保は起きない
+        let text = build(" \r\n");
+        assert!(text.len() >= PARALLEL_TUPLE_LIST_BYTES);
+        let mut values = Vec::new();
+        values.reserve_exact(expected.len());
+        let capacity = values.capacity();
+        parse_tuple_list(text.as_bytes(), &mut values).unwrap();
+        assert_eq!(values, expected);
+        assert_eq!(values.capacity(), capacity);
+
+        // 値のない行が混ざっていても、後続のチャンクが詰められて並びが保たれる
+        let text = build("label only\n");
+        let mut values = Vec::new();
+        parse_tuple_list(text.as_bytes(), &mut values).unwrap();
+        assert_eq!(values, expected);
+    }
+
+    #[test]
+    fn test_find_comma() {
+        let plain = [b'x'; 24];
+        for len in 0..plain.len() {
+            for pos in 0..len {
+                let mut bytes = vec![b'x'; len];
+                bytes[pos] = b',';
+                if pos + 1 < len {
+                    bytes[len - 1] = b',';
+                }
+                assert_eq!(find_comma(&bytes), Some(pos), "len={} pos={}", len, pos);
+            }
+            assert_eq!(find_comma(&plain[..len]), None);
+        }
+
+        let line = "地表面,100.1".as_bytes();
+        assert_eq!(find_comma(line), line.iter().position(|&b| b == b','));
+    }
+
+    #[test]
+    fn test_split_at_lines() {
+        let text = b"a,1\nb,2\nc,3\nd,4\n";
+        let chunks = split_at_lines(text, 3);
+        assert_eq!(chunks.concat(), text.to_vec());
+        assert!(chunks.iter().all(|chunk| chunk.ends_with(b"\n")));
+    }
+
+    #[test]
+    fn test_parse_start_point_padding() {
+        let xml = r#"<?xml version="1.0" encoding="UTF-8"?>
+<Dataset xmlns="http://fgd.japan.go.jp/spec/2008/FGD_GMLSchema" xmlns:gml="http://www.opengis.net/gml/3.2">
+<DEM>
+    <mesh>12345678</mesh>
+    <type>1mメッシュ（標高）</type>
+    <coverage>
+        <gml:boundedBy>
+            <gml:Envelope srsName="fguuid:jgd2011.bl">
+                <gml:lowerCorner>35.0 135.0</gml:lowerCorner>
+                <gml:upperCorner>35.001 135.001</gml:upperCorner>
+            </gml:Envelope>
+        </gml:boundedBy>
+        <gml:gridDomain>
+            <gml:Grid>
+                <gml:limits>
+                    <gml:GridEnvelope>
+                        <gml:high>2 1</gml:high>
+                    </gml:GridEnvelope>
+                </gml:limits>
+            </gml:Grid>
+        </gml:gridDomain>
+        <gml:rangeSet>
+            <gml:DataBlock>
+                <gml:tupleList>
+地表面,101.0
+地表面,102.0
+地表面,103.0
+地表面,104.0
+                </gml:tupleList>
+            </gml:DataBlock>
+        </gml:rangeSet>
+        <gml:coverageFunction>
+            <gml:GridFunction>
+                <gml:startPoint>2 0</gml:startPoint>
+            </gml:GridFunction>
+        </gml:coverageFunction>
+    </coverage>
+</DEM>
+</Dataset>"#;
+
+        let result = parse_dem_xml(xml.as_bytes()).unwrap();
+        assert_eq!(result.start_point, (2, 0));
+        assert!(result.validate());
+        assert_eq!(
+            result.values,
+            vec![-9999.0, -9999.0, 101.0, 102.0, 103.0, 104.0]
+        );
     }
 }
@@ -1,10 +1,11 @@
 use crate::model::DemTile;
 use crate::parser;
-use crate::terrain_rgb::{TerrainRgbConfig, elevation_to_rgb, rgb_to_elevation};
+use crate::terrain_rgb::{elevation_to_rgb, rgb_to_elevation, TerrainRgbConfig};
 use crate::writer::GeoTiffWriter;
+use numpy::{IntoPyArray, PyArray1, PyArray2, PyArrayMethods};
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use std::fs::File;
-use std::io::BufReader;
 use std::path::Path;
 
 #[pymodule]
@@ -12,14 +13,15 @@ fn japan_dem(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyDemTile>()?;
     m.add_class::<PyMetadata>()?;
     m.add_function(wrap_pyfunction!(parse_dem_xml, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_dem_xml_batch, m)?)?;
     m.add_function(wrap_pyfunction!(dem_to_terrain_rgb, m)?)?;
+    m.add_function(wrap_pyfunction!(dem_to_geotiff_bytes, m)?)?;
     m.add_function(wrap_pyfunction!(elevation_to_rgb_py, m)?)?;
     m.add_function(wrap_pyfunction!(rgb_to_elevation_py, m)?)?;
     Ok(())
 }
 
 #[pyclass(name = "DemTile")]
-#[derive(Clone)]
 pub struct PyDemTile {
     #[pyo3(get)]
     pub rows: usize,
@@ -33,12 +35,15 @@ pub struct PyDemTile {
     pub x_res: f64,
     #[pyo3(get)]
     pub y_res: f64,
-    #[pyo3(get)]
-    pub values: Vec<f32>,
+    /// パース結果のVecをコピーせずに所有するnumpy配列
+    pub values: Py<PyArray1<f32>>,
     #[pyo3(get)]
     pub start_point: (usize, usize),
     #[pyo3(get)]
     pub metadata: PyMetadata,
+    /// GDAL形式のGeoTransform（DemTile::geo_transformの値をパース時に一度だけ求める）
+    #[pyo3(get)]
+    pub geo_transform: [f64; 6],
 }
 
 #[pyclass(name = "Metadata")]
@@ -50,10 +55,15 @@ pub struct PyMetadata {
     pub dem_type: String,
     #[pyo3(get)]
     pub crs_identifier: String,
+    /// crs_identifierから推定したEPSGコード（パース時に一度だけ求める）
+    #[pyo3(get)]
+    pub epsg_code: Option<u32>,
 }
 
-impl From<DemTile> for PyDemTile {
-    fn from(tile: DemTile) -> Self {
+impl PyDemTile {
+    fn from_dem_tile(py: Python<'_>, tile: DemTile) -> Self {
+        let epsg_code = tile.guess_epsg();
+        let geo_transform = tile.geo_transform();
         PyDemTile {
             rows: tile.rows,
             cols: tile.cols,
@@ -61,13 +71,15 @@ impl From<DemTile> for PyDemTile {
             origin_lat: tile.origin_lat,
             x_res: tile.x_res,
             y_res: tile.y_res,
-            values: tile.values,
+            values: tile.values.into_pyarray_bound(py).unbind(),
             start_point: tile.start_point,
             metadata: PyMetadata {
                 mesh_code: tile.metadata.meshcode,
                 dem_type: tile.metadata.dem_type,
                 crs_identifier: tile.metadata.crs_identifier,
+                epsg_code,
             },
+            geo_transform,
         }
     }
 }
@@ -79,6 +91,17 @@ impl PyDemTile {
         (self.rows, self.cols)
     }
 
+    #[getter]
+    fn values(&self, py: Python<'_>) -> Py<PyArray1<f32>> {
+        self.values.clone_ref(py)
+    }
+
+    /// valuesを rows x cols として参照するビュー（コピーなし）
+    #[getter]
+    fn values_2d<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        self.values.bind(py).reshape([self.rows, self.cols])
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "DemTile(rows={}, cols={}, origin=({}, {}), resolution=({}, {}), mesh_code={})",
@@ -103,44 +126,66 @@ impl PyMetadata {
     }
 }
 
-#[pyfunction]
-pub fn parse_dem_xml(path: &str) -> PyResult<PyDemTile> {
+fn read_dem_xml(path: &str) -> PyResult<DemTile> {
     let file = File::open(path).map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to open file: {}", e))
     })?;
-    let reader = BufReader::new(file);
 
-    let dem_tile = parser::parse_dem_xml(reader).map_err(|e| {
+    parser::parse_dem_xml_from_file(&file).map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to parse XML: {}", e))
+    })
+}
+
+/// ファイルの読み込みとパースはGILを解放した状態で行う
+#[pyfunction]
+pub fn parse_dem_xml(py: Python<'_>, path: &str) -> PyResult<PyDemTile> {
+    let dem_tile = py.allow_threads(|| read_dem_xml(path))?;
+
+    Ok(PyDemTile::from_dem_tile(py, dem_tile))
+}
+
+/// 複数のXMLファイルをGILを解放した状態で並列にパースする
+#[pyfunction]
+pub fn parse_dem_xml_batch(py: Python<'_>, paths: Vec<String>) -> PyResult<Vec<PyDemTile>> {
+    use rayon::prelude::*;
+
+    let dem_tiles = py.allow_threads(|| {
+        paths
+            .par_iter()
+            .map(|path| read_dem_xml(path))
+            .collect::<PyResult<Vec<_>>>()
     })?;
 
-    Ok(PyDemTile::from(dem_tile))
+    Ok(dem_tiles
+        .into_iter()
+        .map(|dem_tile| PyDemTile::from_dem_tile(py, dem_tile))
+        .collect())
 }
 
-impl From<PyDemTile> for DemTile {
-    fn from(py_tile: PyDemTile) -> Self {
-        DemTile {
-            rows: py_tile.rows,
-            cols: py_tile.cols,
-            origin_lon: py_tile.origin_lon,
-            origin_lat: py_tile.origin_lat,
-            x_res: py_tile.x_res,
-            y_res: py_tile.y_res,
-            values: py_tile.values,
-            start_point: py_tile.start_point,
+impl PyDemTile {
+    fn to_dem_tile(&self, py: Python<'_>) -> PyResult<DemTile> {
+        Ok(DemTile {
+            rows: self.rows,
+            cols: self.cols,
+            origin_lon: self.origin_lon,
+            origin_lat: self.origin_lat,
+            x_res: self.x_res,
+            y_res: self.y_res,
+            values: self.values.bind(py).to_vec()?,
+            start_point: self.start_point,
             metadata: crate::model::Metadata {
-                meshcode: py_tile.metadata.mesh_code,
-                dem_type: py_tile.metadata.dem_type,
-                crs_identifier: py_tile.metadata.crs_identifier,
+                meshcode: self.metadata.mesh_code.clone(),
+                dem_type: self.metadata.dem_type.clone(),
+                crs_identifier: self.metadata.crs_identifier.clone(),
             },
-        }
+        })
     }
 }
 
 #[pyfunction]
 #[pyo3(signature = (dem_tile, output_path, min_elevation=None, max_elevation=None))]
 pub fn dem_to_terrain_rgb(
-    dem_tile: PyDemTile,
+    dem_tile: PyRef<'_, PyDemTile>,
     output_path: &str,
     min_elevation: Option<f32>,
     max_elevation: Option<f32>,
@@ -150,10 +195,38 @@ pub fn dem_to_terrain_rgb(
         max_elevation,
     };
 
-    let dem_tile: DemTile = dem_tile.into();
-    let writer = GeoTiffWriter::new();
-    writer.write_terrain_rgb(&dem_tile, Path::new(output_path), &config)
-        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to convert to terrain RGB: {}", e)))
+    let py = dem_tile.py();
+    let dem_tile = dem_tile.to_dem_tile(py)?;
+    py.allow_threads(|| {
+        let writer = GeoTiffWriter::new();
+        writer.write_terrain_rgb(&dem_tile, Path::new(output_path), &config)
+    })
+    .map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
+            "Failed to convert to terrain RGB: {}",
+            e
+        ))
+    })
+}
+
+/// 一時ファイルを作らずにGeoTIFFのバイト列を生成する
+#[pyfunction]
+pub fn dem_to_geotiff_bytes<'py>(
+    py: Python<'py>,
+    dem_tile: PyRef<'py, PyDemTile>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    // numpy配列からのコピーはここでの一度だけで、書き出しはそのVecをGDALへ渡す
+    let dem_tile = dem_tile.to_dem_tile(py)?;
+    let bytes = py
+        .allow_threads(|| GeoTiffWriter::new().write_to_bytes(dem_tile))
+        .map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
+                "Failed to convert to GeoTIFF: {}",
+                e
+            ))
+        })?;
+
+    Ok(PyBytes::new_bound(py, &bytes))
 }
 
 #[pyfunction]
@@ -1,14 +1,60 @@
 use anyhow::{Context, Result};
+use gdal::cpl::CslStringList;
 use gdal::raster::Buffer;
 use gdal::spatial_ref::SpatialRef;
 use gdal::{DriverManager, Metadata};
+use std::collections::HashMap;
 use std::path::Path;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{Mutex, OnceLock};
 
 use crate::model::DemTile;
 use crate::terrain_rgb::{elevation_to_rgb, TerrainRgbConfig};
 
 const NODATA_VALUE: f64 = -9999.0;
 
+/// 標高GeoTIFFの作成オプション
+///
+/// タイル化したうえで浮動小数点用のPREDICTOR=3とLZW圧縮をかけ、
+/// ファイルサイズと読み込み時の帯域を削減する
+fn elevation_creation_options() -> Result<CslStringList> {
+    let mut options = CslStringList::new();
+    for (name, value) in [
+        ("TILED", "YES"),
+        ("BLOCKXSIZE", "256"),
+        ("BLOCKYSIZE", "256"),
+        ("COMPRESS", "LZW"),
+        ("PREDICTOR", "3"),
+    ] {
+        options
+            .set_name_value(name, value)
+            .context("Failed to set creation option")?;
+    }
+    Ok(options)
+}
+
+/// EPSGコードに対応するWKTを取得する
+///
+/// SpatialRefの生成はPROJデータベースを参照するため、結果をプロセス内でキャッシュし
+/// タイルごとの書き出しで繰り返し検索しないようにする
+fn wkt_for_epsg(epsg: u32) -> Result<String> {
+    static WKT_CACHE: OnceLock<Mutex<HashMap<u32, String>>> = OnceLock::new();
+    let cache = WKT_CACHE.get_or_init(Default::default);
+
+    if let Some(wkt) = cache.lock().unwrap().get(&epsg) {
+        return Ok(wkt.clone());
+    }
+
+    let srs = SpatialRef::from_epsg(epsg)
+        .context(format!("Failed to create SpatialRef from EPSG:{}", epsg))?;
+    let wkt = srs
+        .to_wkt()
+        .context("Failed to convert SpatialRef to WKT")?;
+    cache.lock().unwrap().insert(epsg, wkt.clone());
+
+    Ok(wkt)
+}
+
 #[derive(Default)]
 pub struct GeoTiffWriter {}
 
@@ -18,7 +64,37 @@ impl GeoTiffWriter {
     }
 
     pub fn write(&self, dem_tile: &DemTile, output_path: &Path) -> Result<()> {
-        self.write_standard(dem_tile, output_path)
+        self.write_standard(dem_tile, dem_tile.values.clone(), output_path)
+    }
+
+    /// writeと同じだが、タイルを受け取って標高値を複製せずにGDALへ渡す
+    pub fn write_owned(&self, mut dem_tile: DemTile, output_path: &Path) -> Result<()> {
+        let values = std::mem::take(&mut dem_tile.values);
+        self.write_standard(&dem_tile, values, output_path)
+    }
+
+    /// GeoTIFFを一時ファイルを介さずGDALの/vsimem/上に書き出し、そのバイト列を返す
+    ///
+    /// write_ownedと同様にタイルを受け取り、標高値を複製せずにGDALへ渡す
+    pub fn write_to_bytes(&self, mut dem_tile: DemTile) -> Result<Vec<u8>> {
+        static MEM_FILE_ID: AtomicUsize = AtomicUsize::new(0);
+
+        // 並列に書き出しても衝突しないようプロセス内で一意なパスにする
+        let mem_path = format!(
+            "/vsimem/japan_dem_{}_{}.tif",
+            dem_tile.metadata.meshcode,
+            MEM_FILE_ID.fetch_add(1, Ordering::Relaxed)
+        );
+
+        let values = std::mem::take(&mut dem_tile.values);
+        if let Err(e) = self.write_standard(&dem_tile, values, Path::new(&mem_path)) {
+            let _ = gdal::vsi::unlink_mem_file(&mem_path);
+            return Err(e);
+        }
+
+        // 取得と同時にメモリファイルは削除される
+        gdal::vsi::get_vsi_mem_file_bytes_owned(&mem_path)
+            .context("Failed to read in-memory GeoTIFF")
     }
 
     pub fn write_terrain_rgb(
@@ -75,19 +151,27 @@ impl GeoTiffWriter {
         Ok(())
     }
 
-    fn write_standard(&self, dem_tile: &DemTile, output_path: &Path) -> Result<()> {
+    /// valuesはdem_tile.valuesと同じ並びの標高値で、GDALのバッファとしてそのまま使う
+    fn write_standard(
+        &self,
+        dem_tile: &DemTile,
+        values: Vec<f32>,
+        output_path: &Path,
+    ) -> Result<()> {
         // GTiffドライバーを取得
         let driver =
             DriverManager::get_driver_by_name("GTiff").context("Failed to get GTiff driver")?;
 
         // データセットを作成
         let (rows, cols) = dem_tile.shape();
+        let options = elevation_creation_options()?;
         let mut dataset = driver
-            .create_with_band_type::<f32, _>(
+            .create_with_band_type_with_options::<f32, _>(
                 output_path,
                 cols,
                 rows,
                 1, // バンド数
+                &options,
             )
             .context("Failed to create dataset")?;
 
@@ -98,11 +182,7 @@ impl GeoTiffWriter {
 
         // 座標系を設定
         if let Some(epsg) = dem_tile.guess_epsg() {
-            let srs = SpatialRef::from_epsg(epsg)
-                .context(format!("Failed to create SpatialRef from EPSG:{}", epsg))?;
-            let wkt = srs
-                .to_wkt()
-                .context("Failed to convert SpatialRef to WKT")?;
+            let wkt = wkt_for_epsg(epsg)?;
             dataset
                 .set_projection(&wkt)
                 .context("Failed to set projection")?;
@@ -122,7 +202,8 @@ impl GeoTiffWriter {
             .context("Failed to set no data value")?;
 
         // データを書き込み（GDALは行優先順を期待）
-        let mut buffer = Buffer::new((cols, rows), dem_tile.values.clone());
+        // startPoint分のNoDataはパース時に埋められているため、全体を一度に書き込む
+        let mut buffer = Buffer::new((cols, rows), values);
         band.write((0, 0), (cols, rows), &mut buffer)
             .context("Failed to write raster data")?;
 
@@ -145,11 +226,7 @@ impl GeoTiffWriter {
 
         // 座標系を設定
         if let Some(epsg) = dem_tile.guess_epsg() {
-            let srs = SpatialRef::from_epsg(epsg)
-                .context(format!("Failed to create SpatialRef from EPSG:{}", epsg))?;
-            let wkt = srs
-                .to_wkt()
-                .context("Failed to convert SpatialRef to WKT")?;
+            let wkt = wkt_for_epsg(epsg)?;
             dataset
                 .set_projection(&wkt)
                 .context("Failed to set projection")?;
@@ -257,6 +334,55 @@ mod tests {
         let band = dataset.rasterband(1).unwrap();
         let nodata = band.no_data_value().unwrap();
         assert_eq!(nodata, NODATA_VALUE);
+
+        let compression = dataset.metadata_item("COMPRESSION", "IMAGE_STRUCTURE");
+        assert_eq!(compression.as_deref(), Some("LZW"));
+    }
+
+    #[test]
+    fn test_write_to_bytes() {
+        if !init_gdal() {
+            eprintln!("Skipping test: GTiff driver not available in bundled GDAL");
+            return;
+        }
+        let dem_tile = create_test_tile();
+        let writer = GeoTiffWriter::new();
+
+        let bytes = writer.write_to_bytes(dem_tile).unwrap();
+
+        // TIFFのマジックナンバー（リトルエンディアン）
+        assert_eq!(&bytes[..4], b"II*\0");
+    }
+
+    #[test]
+    fn test_write_partial_tile() {
+        if !init_gdal() {
+            eprintln!("Skipping test: GTiff driver not available in bundled GDAL");
+            return;
+        }
+        let temp_dir = TempDir::new().unwrap();
+        let output_path = temp_dir.path().join("partial.tif");
+
+        let mut dem_tile = create_test_tile();
+        dem_tile.start_point = (1, 0);
+        dem_tile.values[0] = NODATA_VALUE as f32;
+        let writer = GeoTiffWriter::new();
+
+        writer.write(&dem_tile, &output_path).unwrap();
+
+        // 先頭のNoDataと実データの両方が元の並びどおりに書き込まれていることを確認
+        let dataset = Dataset::open(&output_path).unwrap();
+        let band = dataset.rasterband(1).unwrap();
+        let buffer = band.read_band_as::<f32>().unwrap();
+        assert_eq!(buffer.data(), dem_tile.values.as_slice());
+
+        // タイルを渡すwrite_ownedでも同じ内容が書き込まれる
+        let owned_path = temp_dir.path().join("partial_owned.tif");
+        writer.write_owned(dem_tile.clone(), &owned_path).unwrap();
+        let dataset = Dataset::open(&owned_path).unwrap();
+        let band = dataset.rasterband(1).unwrap();
+        let buffer = band.read_band_as::<f32>().unwrap();
+        assert_eq!(buffer.data(), dem_tile.values.as_slice());
     }
 
     #[test]
@@ -289,46 +289,48 @@ impl MergedDemTile {
             }
 
             // データコピー（重複を考慮）
-            for row in 0..tile.rows {
-                for col in 0..tile.cols {
-                    // 重複ピクセルのスキップ判定
-                    // グリッド内で左端でない場合、左端の列をスキップ
-                    if grid_x > min_grid_x && col == 0 {
-                        continue;
-                    }
-                    // グリッド内で上端でない場合、上端の行をスキップ
-                    // Y座標が大きいほど北なので、grid_y < max_grid_yの場合は上端ではない
-                    if grid_y < 9 && row == 0 {
+            // グリッド内で左端でない場合は左端の列を、上端でない場合は上端の行をスキップする
+            // Y座標が大きいほど北なので、grid_y < 9 の場合は上端ではない
+            // ループ内で変わらない判定やオフセットは先に求めておく
+            let skip_left = grid_x > min_grid_x;
+            let skip_top = grid_y < 9;
+            let first_row = usize::from(skip_top);
+            let first_col = usize::from(skip_left);
+            let src_cols = tile.cols;
+            let src_values = tile.values.as_slice();
+
+            for row in first_row..tile.rows {
+                let dst_row = tile_row_offset + row - first_row;
+                let src_start = row * src_cols;
+                if dst_row >= merged_rows || src_start >= src_values.len() {
+                    break;
+                }
+                let src_end = (src_start + src_cols).min(src_values.len());
+                let dst_start = dst_row * merged_cols;
+
+                for (col, &value) in src_values[src_start..src_end]
+                    .iter()
+                    .enumerate()
+                    .skip(first_col)
+                {
+                    // NoDataでない値のみを書き込む
+                    if value == -9999.0 {
                         continue;
                     }
 
-                    let src_idx = row * tile.cols + col;
-                    if src_idx < tile.values.len() {
-                        let value = tile.values[src_idx];
-
-                        // NoDataでない値のみを書き込む
-                        if value != -9999.0 {
-                            // 調整後の位置を計算（スキップした分を考慮）
-                            let adjusted_row = if grid_y < 9 { row - 1 } else { row };
-                            let adjusted_col = if grid_x > min_grid_x { col - 1 } else { col };
-
-                            let dst_row = tile_row_offset + adjusted_row;
-                            let dst_col = tile_col_offset + adjusted_col;
-
-                            if dst_row < merged_rows && dst_col < merged_cols {
-                                let dst_idx = dst_row * merged_cols + dst_col;
-
-                                // デバッグ: 境界部分のデータ
-                                if i < 11 && (row < 2 || col < 2) {
-                                    debug!("Tile {} (grid {},{}) data[{},{}] = {} -> merged[{},{}] (skip_top={}, skip_left={})",
-                                        i, grid_x, grid_y, row, col, value, dst_row, dst_col,
-                                        grid_y < 9 && row == 0, grid_x > min_grid_x && col == 0);
-                                }
+                    let dst_col = tile_col_offset + col - first_col;
+                    if dst_col >= merged_cols {
+                        break;
+                    }
 
-                                merged_values[dst_idx] = value;
-                            }
-                        }
+                    // デバッグ: 境界部分のデータ
+                    if i < 11 && (row < 2 || col < 2) {
+                        debug!("Tile {} (grid {},{}) data[{},{}] = {} -> merged[{},{}] (skip_top={}, skip_left={})",
+                            i, grid_x, grid_y, row, col, value, dst_row, dst_col,
+                            skip_top, skip_left);
                     }
+
+                    merged_values[dst_start + dst_col] = value;
                 }
             }
         }
@@ -347,6 +349,18 @@ impl MergedDemTile {
     }
 
     pub fn to_dem_tile(&self) -> DemTile {
+        self.build_dem_tile(self.merged_values.clone())
+    }
+
+    /// 結合結果をDemTileに変換する
+    ///
+    /// to_dem_tileと異なりmerged_valuesを複製せずに移動し、元のタイルも解放する
+    pub fn into_dem_tile(mut self) -> DemTile {
+        let values = std::mem::take(&mut self.merged_values);
+        self.build_dem_tile(values)
+    }
+
+    fn build_dem_tile(&self, values: Vec<f32>) -> DemTile {
         DemTile {
             rows: self.merged_rows,
             cols: self.merged_cols,
@@ -354,7 +368,7 @@ impl MergedDemTile {
             origin_lat: self.merged_origin_lat,
             x_res: self.merged_x_res,
             y_res: self.merged_y_res,
-            values: self.merged_values.clone(),
+            values,
             start_point: (0, 0),
             metadata: crate::model::Metadata {
                 meshcode: format!("merged_{}", self.tiles.len()),
@@ -364,3 +378,57 @@ impl MergedDemTile {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::model::Metadata;
+
+    const NODATA: f32 = -9999.0;
+
+    fn create_tile(meshcode: &str, origin_lon: f64, origin_lat: f64, cols: usize) -> DemTile {
+        let rows = 2;
+        DemTile {
+            rows,
+            cols,
+            origin_lon,
+            origin_lat,
+            x_res: 1.0,
+            y_res: 1.0,
+            values: vec![0.0; rows * cols],
+            start_point: (0, 0),
+            metadata: Metadata {
+                meshcode: meshcode.to_string(),
+                dem_type: "5A".to_string(),
+                crs_identifier: "fguuid:jgd2011.bl".to_string(),
+            },
+        }
+    }
+
+    #[test]
+    fn test_merge_tiles() {
+        // メッシュコードの下2桁がYX
+        // A: 北西 (x=0, y=9)、B: 北東 (x=1, y=9)、C: 南西 (x=0, y=8)
+        let mut a = create_tile("12345690", 0.0, 10.0, 3);
+        a.values = vec![1.0, 2.0, 3.0, NODATA, 5.0, 6.0];
+        // Bは他より1列広く、右端の列は結合範囲の外にはみ出す
+        let mut b = create_tile("12345691", 2.0, 10.0, 5);
+        b.values = vec![10.0, 11.0, NODATA, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0];
+        let mut c = create_tile("12345680", 0.0, 9.0, 3);
+        c.values = vec![20.0, 21.0, 22.0, 23.0, NODATA, 25.0];
+
+        let merged = MergedDemTile::from_tiles(vec![c, b, a]).unwrap();
+        assert_eq!((merged.merged_rows, merged.merged_cols), (3, 7));
+
+        #[rustfmt::skip]
+        let expected = vec![
+            1.0, 2.0, 3.0, NODATA, 11.0, NODATA, 13.0,
+            23.0, 5.0, 6.0, NODATA, 16.0, 17.0, 18.0,
+            NODATA, NODATA, NODATA, NODATA, NODATA, NODATA, NODATA,
+        ];
+        // - Cは上端の行（20, 21, 22）を、Bは左端の列（10, 15）をスキップする
+        // - NoDataは書き込まれない（Aの (1, 0) はCの23のまま、Bの (0, 5) はNoDataのまま）
+        // - 結合範囲の外にはみ出すBの右端の列（14, 19）は捨てられる
+        assert_eq!(merged.merged_values, expected);
+    }
+}